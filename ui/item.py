@@ -1,42 +1,203 @@
 """Items to use on model and view."""
 from __future__ import annotations
 
+import sys
+import weakref
+from collections import deque
 from collections.abc import Iterator
-from typing import Any, TypeVar, Generic
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 TT = TypeVar("TT")
 
-class Item(Generic[T]):
+class Item:
     """Base item used in view."""
 
+    __slots__ = ("name", "data", "__weakref__")
+
     def __init__(self, name: str, data: Any | None = None):
-        self.name = name
-        self.data = data
+        self.name: str = sys.intern(name) if type(name) is str else name
+        self.data: Any | None = data
 
-class TreeItem(Generic[TT]):
+class TreeItem(Item):
     """Base item used in TreeView."""
 
+    __slots__ = ("_parent_ref", "_children", "_fill", "_index",
+                 "_children_view", "_desc_count")
+
     def __init__(self, name: str, data: Any | None = None,
-                 parent: TT | None = None):
-        self.name = name
-        self.data = data
-        self.__parent = parent
-        self.__children = []
+                 parent: TT | None = None, expected_children: int = 0):
+        self.name: str = sys.intern(name) if type(name) is str else name
+        self.data: Any | None = data
+        self._parent_ref: weakref.ref[TT] | None = (
+            weakref.ref(parent) if parent is not None else None)
+        self._children: list[TT] = (
+            [None] * expected_children if expected_children else [])
+        self._fill: int = 0
+        self._index: int = 0
+        self._children_view: tuple[TT, ...] | None = None
+        self._desc_count: int = 0
 
     def insert_child(self, children: TT, pos: int = -1):
-        """Insert given tree item in children in given position."""
-        self.__children.insert(pos, children)
-        children.parent = self
+        """Insert given tree item in children in given position.
+
+        A negative or out-of-range pos appends, through the
+        amortized O(1) list.append fast path (or a preallocated slot
+        when the item was built with expected_children).
+        """
+        old_parent = children.parent
+
+        if old_parent is not None:
+            old_parent.remove_child(children)
+
+        count = self._fill
+
+        if pos < 0 or pos >= count:
+            if count < len(self._children):
+                self._children[count] = children
+            else:
+                self._children.append(children)
+
+            start = count
+        else:
+            self._trim()
+            self._children.insert(pos, children)
+            start = pos
+
+        self._fill = count + 1
+        self._children_view = None
+        children._parent_ref = weakref.ref(self)
+        self._grow_descendants(1 + children._desc_count)
+
+        for i in range(start, self._fill):
+            self._children[i]._index = i
+
+    def insert_children(self, children: list[TT], pos: int = -1):
+        """Insert the given tree items in children in given position.
+
+        Splices the whole batch in one list operation and reparents in
+        a single pass, so inserting n children shifts the tail once
+        instead of n times.
+        """
+        children = list(children)
+
+        for child in children:
+            old_parent = child.parent
+
+            if old_parent is not None and old_parent is not self:
+                old_parent.remove_child(child)
+
+            child._parent_ref = weakref.ref(self)
+
+        self._trim()
+
+        if pos < 0:
+            pos = len(self._children) + pos + 1
+
+        self._children[pos:pos] = children
+        self._fill = len(self._children)
+        self._children_view = None
+        self._grow_descendants(sum(1 + c._desc_count for c in children))
+
+        for i in range(pos, len(self._children)):
+            self._children[i]._index = i
 
     def remove_child(self, child: TT):
         """Remove given item from children."""
-        self.__children.remove(child)
-        child.parent = None
+        pos = child._index
+
+        if pos >= self._fill or self._children[pos] is not child:
+            raise ValueError(f"{child.name!r} is not a child of {self.name!r}.")
+
+        self._trim()
+        del self._children[pos]
+        self._fill -= 1
+        self._children_view = None
+        child._parent_ref = None
+        self._grow_descendants(-1 - child._desc_count)
+
+        for i in range(pos, len(self._children)):
+            self._children[i]._index = i
+
+    def remove_children(self, start: int, count: int):
+        """Remove count children from the given position in one slice."""
+        self.pop_children(start, count)
+
+    def pop_children(self, start: int, count: int) -> list[TT]:
+        """Detach and return count children from the given position."""
+        self._trim()
+        block = self._children[start:start + count]
+
+        for child in block:
+            child._parent_ref = None
+
+        del self._children[start:start + count]
+        self._fill -= len(block)
+        self._children_view = None
+        self._grow_descendants(-sum(1 + c._desc_count for c in block))
+
+        for i in range(start, len(self._children)):
+            self._children[i]._index = i
+
+        return block
+
+    def _trim(self):
+        """Drop unused preallocated child slots."""
+        if self._fill != len(self._children):
+            del self._children[self._fill:]
+
+    @classmethod
+    def build_from_edges(cls, edges, root_key: str) -> TT:
+        """Build a tree from flat (parent_key, key, data) rows.
+
+        One linear pass with a key index, so loading n rows does n
+        dict lookups instead of a find-by-name scan per row. Rows must
+        list a parent before its children; an unknown parent key raises
+        KeyError.
+
+        Args:
+            edges: Iterable of (parent_key, key, data) tuples.
+            root_key: Key of the root item, created automatically.
+        """
+        index = {root_key: cls(root_key)}
+
+        for parent_key, key, data in edges:
+            parent = index[parent_key]
+            node = cls(key, data)
+            index[key] = node
+
+            node._parent_ref = weakref.ref(parent)
+            node._index = parent._fill
+            parent._children.append(node)
+            parent._fill += 1
+
+        root = index[root_key]
+
+        for node in root.iter_postorder():
+            node._desc_count = (
+                node._fill + sum(c._desc_count for c in node._children))
+
+        return root
+
+    def _grow_descendants(self, delta: int):
+        """Propagate a descendant count change up the ancestor chain."""
+        node = self
+
+        while node is not None:
+            node._desc_count += delta
+            node = node.parent
 
     def child(self, pos: int) -> TT:
         """Return the child on given position."""
-        return self.__children[pos]
+        count = self._fill
+
+        if pos < 0:
+            pos += count
+
+        if not 0 <= pos < count:
+            raise IndexError("child index out of range")
+
+        return self._children[pos]
 
     def iter_children(self, recursive: bool = False) -> Iterator[TT]:
         """Iterate children.
@@ -44,50 +205,113 @@ class TreeItem(Generic[TT]):
         Args:
             recursive: Iterate recursively.
         """
-        for child in self.__children:
+        return self._iter_deep() if recursive else iter(self)
+
+    def __iter__(self) -> Iterator[TT]:
+        """Iterate direct children with a plain list iterator."""
+        self._trim()
+        return iter(self._children)
+
+    def _iter_deep(self) -> Iterator[TT]:
+        """Iterate the whole subtree in pre-order."""
+        self._trim()
+        stack = [iter(self._children)]
+
+        while stack:
+            try:
+                child = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
             yield child
 
-            if child.children and recursive:
-                yield from child.iter_children(recursive)
+            if child._fill:
+                child._trim()
+                stack.append(iter(child._children))
 
-    def iter_parent(self) -> Iterator[TT]:
-        """Iterate all parents."""
-        item = self
+    def iter_postorder(self) -> Iterator[TT]:
+        """Iterate the subtree bottom-up, children before parents.
 
-        while True:
-            parent = item.parent
+        Includes the item itself, yielded last. Useful to compute
+        aggregates without recursion.
+        """
+        stack = [(self, False)]
 
-            if parent:
-                yield parent
-            else:
-                return
+        while stack:
+            item, visited = stack.pop()
+
+            if visited:
+                yield item
+                continue
+
+            stack.append((item, True))
+            item._trim()
+
+            for child in reversed(item._children):
+                stack.append((child, False))
 
-            item = parent
+    def repack_level_order(self):
+        """Rebuild the child lists of the subtree in level order.
+
+        Reallocating the lists breadth first keeps sibling storage
+        adjacent in memory after heavy editing, which helps full
+        traversals. Order and content of the tree are unchanged.
+        """
+        queue = deque((self,))
+
+        while queue:
+            item = queue.popleft()
+            item._trim()
+            item._children = list(item._children)
+            queue.extend(item._children)
+
+    def iter_parent(self) -> Iterator[TT]:
+        """Iterate all parents."""
+        parent = self.parent
+
+        while parent is not None:
+            yield parent
+            parent = parent.parent
 
     @property
     def child_count(self) -> int:
         """Return the child count of the tree item."""
-        return len(self.__children)
+        return self._fill
+
+    @property
+    def descendant_count(self) -> int:
+        """Return the size of the subtree below the item."""
+        return self._desc_count
 
     @property
     def index(self) -> int:
         """Return the item position of the item parent."""
-        return self.__parent.children.index(self) if self.__parent else 0
+        return self._index if self.parent is not None else 0
 
     @property
-    def children(self) -> list[TT]:
-        """Return children."""
-        return self.__children
+    def children(self) -> tuple[TT, ...]:
+        """Return a read-only view of the children."""
+        view = self._children_view
+
+        if view is None:
+            self._trim()
+            view = self._children_view = tuple(self._children)
+
+        return view
 
     @property
     def parent(self) -> TT | None:
         """Return the parent of the tree item."""
-        return self.__parent
+        ref = self._parent_ref
+        return ref() if ref is not None else None
 
     @parent.setter
     def parent(self, parent: TT | None):
         """Set the parent of the item."""
-        if self.__parent is not None:
-            self.__parent.remove_child(self)
+        old_parent = self.parent
+
+        if old_parent is not None:
+            old_parent.remove_child(self)
 
-        self.__parent = parent
+        self._parent_ref = weakref.ref(parent) if parent is not None else None
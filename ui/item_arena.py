@@ -0,0 +1,149 @@
+"""Array-backed storage for large, read-mostly trees."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from .item import TreeItem
+
+NO_NODE = -1
+
+
+class TreeArena:
+    """Tree stored as parallel arrays for cache-friendly traversals.
+
+    Nodes are plain integer indices into the arrays. Links are kept in
+    compact ``array('i')`` buffers (first-child / next-sibling / parent)
+    so a full walk touches contiguous memory instead of chasing
+    heap-allocated ``TreeItem`` objects.
+    """
+
+    __slots__ = ("names", "datas", "parent_idx", "first_child_idx",
+                 "next_sibling_idx", "_last_child_idx")
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.datas: list[Any] = []
+        self.parent_idx = array("i")
+        self.first_child_idx = array("i")
+        self.next_sibling_idx = array("i")
+        self._last_child_idx = array("i")
+
+    def add_node(self, name: str, data: Any | None = None,
+                 parent: int = NO_NODE) -> int:
+        """Append a node and return its index.
+
+        Args:
+            name: Node name.
+            data: Node payload.
+            parent: Index of the parent node, or NO_NODE for a root.
+        """
+        idx = len(self.names)
+        self.names.append(name)
+        self.datas.append(data)
+        self.parent_idx.append(parent)
+        self.first_child_idx.append(NO_NODE)
+        self.next_sibling_idx.append(NO_NODE)
+        self._last_child_idx.append(NO_NODE)
+
+        if parent != NO_NODE:
+            last = self._last_child_idx[parent]
+
+            if last == NO_NODE:
+                self.first_child_idx[parent] = idx
+            else:
+                self.next_sibling_idx[last] = idx
+
+            self._last_child_idx[parent] = idx
+
+        return idx
+
+    @property
+    def node_count(self) -> int:
+        """Return the number of stored nodes."""
+        return len(self.names)
+
+
+def build_from(root: TreeItem) -> TreeArena:
+    """Pack the given tree into an arena in level order.
+
+    Level-order packing keeps siblings adjacent in the arrays, which
+    matches how views iterate them.
+
+    Args:
+        root: Root item of the tree to pack.
+    """
+    arena = TreeArena()
+    queue = deque([(root, NO_NODE)])
+
+    while queue:
+        item, parent = queue.popleft()
+        idx = arena.add_node(item.name, item.data, parent)
+
+        for child in item.iter_children():
+            queue.append((child, idx))
+
+    return arena
+
+
+def preorder_walk(first_child: array, next_sibling: array,
+                  root: int, out: array) -> int:
+    """Fill out with the pre-order subtree of root and return its size.
+
+    Flat integer kernel over the arena link arrays: no objects, no
+    generator, only index arithmetic on preallocated buffers. Hosts
+    that ship numba can wrap it with njit unchanged; plain CPython runs
+    it as-is.
+
+    Args:
+        first_child: First-child link array of the arena.
+        next_sibling: Next-sibling link array of the arena.
+        root: Index of the subtree root.
+        out: Preallocated buffer of at least subtree size.
+    """
+    stack = array("i", (0,)) * len(first_child)
+    stack[0] = root
+    top = 1
+    count = 0
+
+    while top:
+        top -= 1
+        idx = stack[top]
+        out[count] = idx
+        count += 1
+
+        sibling = next_sibling[idx]
+        if idx != root and sibling != NO_NODE:
+            stack[top] = sibling
+            top += 1
+
+        child = first_child[idx]
+        if child != NO_NODE:
+            stack[top] = child
+            top += 1
+
+    return count
+
+
+def iter_preorder(arena: TreeArena, root_idx: int = 0) -> Iterator[int]:
+    """Iterate the subtree below root_idx in pre-order.
+
+    Args:
+        arena: Arena holding the tree.
+        root_idx: Index of the subtree root.
+    """
+    first_child = arena.first_child_idx
+    next_sibling = arena.next_sibling_idx
+    stack = array("i", [root_idx])
+
+    while stack:
+        idx = stack.pop()
+        yield idx
+
+        if idx != root_idx and next_sibling[idx] != NO_NODE:
+            stack.append(next_sibling[idx])
+
+        if first_child[idx] != NO_NODE:
+            stack.append(first_child[idx])
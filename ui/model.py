@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, TypeVar
 
-import math
-
 import Qt.QtCore as qtc
 
 from .item import Item, TreeItem
@@ -14,73 +13,151 @@ T = TypeVar("T", bound=Item)
 TT = TypeVar("TT", bound=TreeItem)
 
 
+def _valid_parent(parent: qtc.QModelIndex | None) -> qtc.QModelIndex:
+    """Return the given parent index, or the invalid root index."""
+    return qtc.QModelIndex() if parent is None else parent
+
+
 class ListModel(qtc.QAbstractListModel):
     """List Model without columns."""
 
-    DataRole = qtc.Qt.UserRole + 1
+    DataRole = int(qtc.Qt.UserRole + 1)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__items: list[T] = []
+        self.__pos: dict[int, int] = {}
+        self._lock = qtc.QReadWriteLock()
 
     def insert_item(self, item: T, pos: int = -1) -> bool:
-        pos = _get_abs_pos(pos, self.rowCount())
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.insertRow(pos, item=item)
 
     def insert_items(self, items: list[T], pos: int = -1) -> bool:
-        pos = _get_abs_pos(pos, self.rowCount())
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.insertRows(pos, len(items), items=items)
 
     def delete_item(self, item: T) -> bool:
-        return self.removeRow(self.__items.index(item))
+        return self.removeRow(self.__pos[id(item)])
 
     def delete_items(self, items: list[T]):
-        for item in sorted(items, key=lambda i: self.__items.index(i), reverse=True):
-            self.delete_item(item)
+        rows = sorted((self.__pos[id(item)] for item in items), reverse=True)
+
+        if not rows:
+            return
+
+        if len(rows) * 4 > len(self.__items):
+            dead = {id(item) for item in items}
+
+            self.beginResetModel()
+            with qtc.QWriteLocker(self._lock):
+                self.__items[:] = [
+                    item for item in self.__items if id(item) not in dead]
+
+                for key in dead:
+                    self.__pos.pop(key, None)
+
+                self.__reindex()
+            self.endResetModel()
+            return
+
+        start = end = rows[0]
+
+        for row in rows[1:]:
+            if row == start - 1:
+                start = row
+                continue
+
+            self.removeRows(start, end - start + 1)
+            start = end = row
+
+        self.removeRows(start, end - start + 1)
 
     def move_item(self, item: T, pos: int = -1):
-        item_pos = self.__items.index(item)
-        pos = _get_abs_pos(pos, self.rowCount())
+        item_pos = self.__pos[id(item)]
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.moveRow(item_pos, pos)
 
     def move_items(self, items: list[T], pos: int = -1):
-        pos = _get_abs_pos(pos, self.rowCount())
-        for i, item in enumerate(sorted(items, key=lambda idx: self.__items.index(idx), reverse=True)):
-            item_pos = self.__items.index(item)
-            self.moveRow(item_pos, pos + i)
+        if pos < 0:
+            pos += self.rowCount() + 1
+
+        ordered = sorted(items, key=lambda i: self.__pos[id(i)], reverse=True)
+        dst_row = pos
+        i = 0
+
+        while i < len(ordered):
+            start = self.__pos[id(ordered[i])]
+            count = 1
+
+            while (i + count < len(ordered)
+                   and self.__pos[id(ordered[i + count])] == start - count):
+                count += 1
+
+            start -= count - 1
+            self.moveRows(start, count, dst_row)
+
+            if start < dst_row:
+                dst_row -= count
+
+            i += count
+
+    @contextmanager
+    def batch(self, reset: bool = False):
+        """Group many mutations into a single view update.
+
+        Args:
+            reset: Use a full model reset instead of layout signals;
+                cheaper once a batch touches most of the model.
+        """
+        if reset:
+            self.beginResetModel()
+            yield
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            yield
+            self.layoutChanged.emit()
 
     def clear(self):
         self.beginResetModel()
-        del self.__items[:]
+        with qtc.QWriteLocker(self._lock):
+            del self.__items[:]
+            self.__pos.clear()
         self.endResetModel()
 
     def index(self, row: int = 0, column: int = 0,
               parent: qtc.QModelIndex | None = None) -> qtc.QModelIndex:
-        if 0 <= row <= self.rowCount():
-            return self.createIndex(row, column, self.__items[row])
+        with qtc.QReadLocker(self._lock):
+            items = self.__items
+
+            if 0 <= row < len(items):
+                return self.createIndex(row, column, items[row])
 
         return qtc.QModelIndex()
 
     def iter_indices(self) -> Iterator[qtc.QModelIndex]:
-        for i in range(self.rowCount()):
-            index = self.index(i)
+        create_index = self.createIndex
 
-            if index.isValid():
-                yield index
+        for i, item in enumerate(self.__items):
+            yield create_index(i, 0, item)
 
     def rowCount(self, _: qtc.QModelIndex | None = None) -> int:
-        return len(self.__items)
+        with qtc.QReadLocker(self._lock):
+            return len(self.__items)
 
-    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole) -> Any:
-        if not index.isValid():
+    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole,
+             _data_role: int = DataRole) -> Any:
+        if role != _data_role or not index.isValid():
             return None
 
-        item = index.internalPointer()
-
-        if role == self.DataRole:
-            return item.data
-
-        return None
+        return index.internalPointer().data
 
     def insertRow(self, row: int,
                   parent: qtc.QModelIndex | None = None,
@@ -89,12 +166,13 @@ class ListModel(qtc.QAbstractListModel):
         if not 0 <= row <= self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertRows(parent, row, row)
         if item:
-            self.__items.insert(row, item)
+            with qtc.QWriteLocker(self._lock):
+                self.__items.insert(row, item)
+                self.__reindex(row)
         self.endInsertRows()
         return True
 
@@ -109,53 +187,62 @@ class ListModel(qtc.QAbstractListModel):
         if items and len(items) != count:
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertRows(parent, row, row + count - 1)
         if items:
-            for i in range(count):
-                self.__items.insert(row + i, items[i])
+            with qtc.QWriteLocker(self._lock):
+                self.__items[row:row] = items
+                self.__reindex(row)
         self.endInsertRows()
         return True
 
     def removeRow(self, row: int, parent: qtc.QModelIndex | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex
+        parent = _valid_parent(parent)
 
         if not 0 <= row < self.rowCount():
             return False
 
         self.beginRemoveRows(parent, row, row)
-        del self.__items[row]
+        with qtc.QWriteLocker(self._lock):
+            self.__pos.pop(id(self.__items[row]), None)
+            del self.__items[row]
+            self.__reindex(row)
         self.endRemoveRows()
         return True
 
     def removeRows(self, row: int, count: int, parent: qtc.QModelIndex | None = None) -> bool:
         end_row = row + count - 1
-        if not 0 <= row < end_row < self.rowCount():
+        if not 0 <= row <= end_row < self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginRemoveRows(parent, row, end_row)
-        del self.__items[row: end_row + 1]
+        with qtc.QWriteLocker(self._lock):
+            for item in self.__items[row: end_row + 1]:
+                self.__pos.pop(id(item), None)
+            del self.__items[row: end_row + 1]
+            self.__reindex(row)
         self.endRemoveRows()
         return True
 
     def moveRow(self, src_row: int, dst_row: int,
                 parent: qtc.QModelIndex | None = None) \
             -> bool:
-        if not 0 <= src_row | dst_row < self.rowCount():
+        count_ = self.rowCount()
+        if not (0 <= src_row < count_ and 0 <= dst_row <= count_):
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginMoveRows(parent, src_row, src_row, parent, dst_row)
-        item = self.__items.pop(src_row)
-        self.__items.insert(dst_row, item)
+        with qtc.QWriteLocker(self._lock):
+            item = self.__items.pop(src_row)
+
+            insert_at = dst_row - 1 if dst_row > src_row else dst_row
+            self.__items.insert(insert_at, item)
+            self.__reindex(min(src_row, insert_at))
         self.endMoveRows()
         return True
 
@@ -163,21 +250,31 @@ class ListModel(qtc.QAbstractListModel):
                  dst_row: int,
                  parent: qtc.QModelIndex | None = None) -> bool:
         end_row = src_row + count - 1
-        if 0 < src_row | dst_row < self.rowCount():
+        count_ = self.rowCount()
+        if not (0 <= src_row <= end_row < count_ and 0 <= dst_row <= count_):
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginMoveRows(parent, src_row, end_row, parent, dst_row)
-        items = self.__items[src_row: src_row + count]
-        [self.__items.remove(n) for n in items]
+        with qtc.QWriteLocker(self._lock):
+            block = self.__items[src_row: src_row + count]
+            del self.__items[src_row: src_row + count]
 
-        for i in range(count):
-            self.__items.insert(dst_row + count, items[i])
+            insert_at = dst_row - count if dst_row > src_row else dst_row
+            self.__items[insert_at:insert_at] = block
+            self.__reindex(min(src_row, insert_at))
         self.endMoveRows()
         return True
 
+    def __reindex(self, start: int = 0):
+        """Refresh the id->row map from the given row to the end."""
+        items = self.__items
+        pos = self.__pos
+
+        for i in range(start, len(items)):
+            pos[id(items[i])] = i
+
     @property
     def items(self) -> Iterator[T]:
         yield from self.__items
@@ -185,90 +282,127 @@ class ListModel(qtc.QAbstractListModel):
 
 class TableModel(qtc.QAbstractTableModel):
 
-    DataRole = qtc.Qt.UserRole + 1
+    DataRole = int(qtc.Qt.UserRole + 1)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__items = []
         self.COL_COUNT = 1
+        self._lock = qtc.QReadWriteLock()
 
     def insert_item(self, item: T, pos: int = -1):
-        pos = _get_abs_pos(pos, self.rowCount())
-        column = self.rowCount() % self.columnCount()
-
-        if column == 0:
-            self.insertRow(self.rowCount() - 1, item=item)
+        cc = self.columnCount()
+        count = len(self.__items)
+        if pos < 0:
+            pos += count + 1
+
+        if count % cc == 0:
+            row = self.rowCount()
+            self.beginInsertRows(qtc.QModelIndex(), row, row)
+            with qtc.QWriteLocker(self._lock):
+                self.__items.insert(pos, item)
+            self.endInsertRows()
         else:
-            self.__items.insert(pos, item)
-            self.dataChanged.emit(self.rowCount(), column)
+            with qtc.QWriteLocker(self._lock):
+                self.__items.insert(pos, item)
+
+        if not (count % cc == 0 and pos == count):
+            first_row, first_col = divmod(pos, cc)
+            last_row, last_col = divmod(len(self.__items) - 1, cc)
+            self.dataChanged.emit(
+                self.index(first_row, first_col),
+                self.index(last_row, last_col),
+                [self.DataRole],
+            )
 
     def insert_items(self, items: list[T], pos: int = -1):
-        pos = _get_abs_pos(pos, self.rowCount())
+        cc = self.columnCount()
+        if pos < 0:
+            pos += len(self.__items) + 1
+
+        column = len(self.__items) % cc
 
-        column = self.rowCount() % self.columnCount()
         if column:
-            for i in range(self.columnCount() - column):
-                self.__items.insert(pos + i, items.pop(0))
-                self.dataChanged.emit(self.rowCount(), column)
-                pos += 1
+            fill = min(cc - column, len(items))
+            fill_items, items = items[:fill], items[fill:]
+
+            with qtc.QWriteLocker(self._lock):
+                self.__items[pos:pos] = fill_items
+
+            first_row, first_col = divmod(pos, cc)
+            last_row, last_col = divmod(pos + fill - 1, cc)
+            self.dataChanged.emit(
+                self.index(first_row, first_col),
+                self.index(last_row, last_col),
+                [self.DataRole],
+            )
+            pos += fill
 
         if items:
-            row = math.floor(pos / self.columnCount())
+            row = pos // cc
             row_count = (
-                math.ceil(
-                    (len(items) + self.rowCount()) / self.columnCount(),
-                )
+                (len(items) + len(self.__items) + cc - 1) // cc
                 - self.rowCount()
             )
             self.insertRows(row, row_count, items=items)
 
+    @contextmanager
+    def batch(self, reset: bool = False):
+        """Group many mutations into a single view update.
+
+        Args:
+            reset: Use a full model reset instead of layout signals;
+                cheaper once a batch touches most of the model.
+        """
+        if reset:
+            self.beginResetModel()
+            yield
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            yield
+            self.layoutChanged.emit()
+
     def clear(self):
         self.beginResetModel()
-        del self.__items[:]
+        with qtc.QWriteLocker(self._lock):
+            del self.__items[:]
         self.endResetModel()
 
     def index(
         self, row: int = 0, column: int = 0, parent: qtc.QModelIndex | None = None,
     ) -> qtc.QModelIndex:
-        pos = self.columnCount() * row + column
+        cc = self.COL_COUNT
+        pos = cc * row + column
+
+        with qtc.QReadLocker(self._lock):
+            items = self.__items
 
-        if (
-            0 <= row < self.rowCount()
-            and 0 <= column < self.columnCount()
-            and pos < self.rowCount()
-        ):
-            return self.createIndex(row, column, self.__items[pos])
+            if 0 <= row and 0 <= column < cc and pos < len(items):
+                return self.createIndex(row, column, items[pos])
 
         return qtc.QModelIndex()
 
-    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole) -> Any:
-        if not index.isValid():
+    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole,
+             _data_role: int = DataRole) -> Any:
+        if role != _data_role or not index.isValid():
             return None
 
-        item = index.internalPointer()
-
-        if role == self.DataRole:
-            return item.data
-
-        return None
+        return index.internalPointer().data
 
     def iter_indices(self) -> Iterator[qtc.QModelIndex]:
-        row = -1
-        column = 0
-        for i in range(self.rowCount()):
-            if i % self.columnCount() == 0:
-                row += 1
-                column = 0
-            else:
-                column += 1
+        cc = self.columnCount()
+        create_index = self.createIndex
 
-            index = self.index(row, column)
-
-            if index.isValid():
-                yield index
+        for i, item in enumerate(self.__items):
+            row, column = divmod(i, cc)
+            yield create_index(row, column, item)
 
     def rowCount(self, parent: qtc.QModelIndex | None = None) -> int:
-        return math.ceil(len(self.__items) / self.columnCount())
+        cc = self.COL_COUNT
+
+        with qtc.QReadLocker(self._lock):
+            return (len(self.__items) + cc - 1) // cc
 
     def columnCount(self, parent: qtc.QModelIndex | None = None) -> int:
         return self.COL_COUNT
@@ -279,8 +413,7 @@ class TableModel(qtc.QAbstractTableModel):
         parent: qtc.QModelIndex | None = None,
         item: Item | None = None,
     ) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not 0 <= row <= self.rowCount():
             return False
@@ -289,7 +422,9 @@ class TableModel(qtc.QAbstractTableModel):
 
         if item:
             pos = row * self.columnCount()
-            self.__items.insert(pos, item)
+
+            with qtc.QWriteLocker(self._lock):
+                self.__items.insert(pos, item)
 
         self.endInsertRows()
         return True
@@ -303,19 +438,18 @@ class TableModel(qtc.QAbstractTableModel):
     ) -> bool:
         end_row = row + count - 1
 
-        if not 0 <= row < end_row <= self.rowCount():
+        if count < 1 or not 0 <= row <= self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertRows(parent, row, end_row)
 
         if items:
             pos = row * self.columnCount()
 
-            for i in range(len(items)):
-                self.__items.insert(pos + i, items[i])
+            with qtc.QWriteLocker(self._lock):
+                self.__items[pos:pos] = items
 
         self.endInsertRows()
         return True
@@ -329,15 +463,13 @@ class TableModel(qtc.QAbstractTableModel):
         if not 0 <= column <= self.columnCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertColumns(parent, column, column)
 
         # TODO(amallaroni): use node data
-        row_count = abs(
-            math.ceil(self.rowCount() / self.columnCount()) - self.rowCount(),
-        )
+        cc = self.columnCount()
+        row_count = abs((self.rowCount() + cc - 1) // cc - self.rowCount())
 
         if row_count:
             self.removeRows(self.rowCount(), row_count, parent)
@@ -357,15 +489,13 @@ class TableModel(qtc.QAbstractTableModel):
         if not 0 <= column < end_col <= self.columnCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertColumns(parent, column, end_col)
 
         # TODO(amallaroni): use node data
-        row_count = abs(
-            math.ceil(self.rowCount() / self.columnCount()) - self.rowCount(),
-        )
+        cc = self.columnCount()
+        row_count = abs((self.rowCount() + cc - 1) // cc - self.rowCount())
 
         if row_count:
             self.removeRows(self.rowCount(), row_count, parent)
@@ -377,14 +507,16 @@ class TableModel(qtc.QAbstractTableModel):
         if not 0 < row < self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginRemoveRows(parent, row, row)
 
-        pos = row * self.columnCount()
-        end_pos = min(pos + self.columnCount(), self.rowCount())
-        del self.__items[pos:end_pos]
+        cc = self.columnCount()
+        pos = row * cc
+
+        with qtc.QWriteLocker(self._lock):
+            end_pos = min(pos + cc, len(self.__items))
+            del self.__items[pos:end_pos]
 
         self.endRemoveRows()
         return True
@@ -392,26 +524,27 @@ class TableModel(qtc.QAbstractTableModel):
     def removeRows(
             self, row: int, count: int, parent: qtc.QModelIndex | None = None
     ) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         end_row = row + count - 1
 
-        if not 0 <= row < end_row <= self.rowCount():
+        if not 0 <= row <= end_row <= self.rowCount():
             return False
 
         self.beginRemoveRows(parent, row, end_row)
 
-        pos = row * self.columnCount()
-        end_pos = min(pos + (count * self.columnCount()), self.rowCount())
-        del self.__items[pos:end_pos]
+        cc = self.columnCount()
+        pos = row * cc
+
+        with qtc.QWriteLocker(self._lock):
+            end_pos = min(pos + count * cc, len(self.__items))
+            del self.__items[pos:end_pos]
 
         self.endRemoveRows()
         return True
 
     def removeColumn(self, column: int, parent: qtc.QModelIndex | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         return self.removeColumns(column, 1, parent)
 
@@ -423,12 +556,12 @@ class TableModel(qtc.QAbstractTableModel):
         if not 0 < column < end_col < self.columnCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginRemoveColumns(parent, column, end_col)
 
-        row_count = math.ceil(self.rowCount() / self.columnCount()) - self.rowCount()
+        cc = self.columnCount()
+        row_count = (self.rowCount() + cc - 1) // cc - self.rowCount()
 
         if row_count:
             self.insertRows(self.rowCount(), row_count, parent)
@@ -441,70 +574,144 @@ class ListTreeModel(qtc.QAbstractItemModel):
     """List on Tree Model with columns."""
 
     HEADERS_NAME: tuple[str] = ("Name",)
-    DataRole = qtc.Qt.UserRole + 1
+    DataRole = int(qtc.Qt.UserRole + 1)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__items: list[T] = []
+        self.__pos: dict[int, int] = {}
+        self._lock = qtc.QReadWriteLock()
         self.COL_COUNT = len(self.HEADERS_NAME)
 
     def insert_item(self, item: T, pos: int = -1) -> bool:
-        pos = _get_abs_pos(pos, self.rowCount())
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.insertRow(pos, item=item)
 
     def insert_items(self, items: list[T], pos: int = -1) -> bool:
-        pos = _get_abs_pos(pos, self.rowCount())
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.insertRows(pos, len(items), items=items)
 
     def delete_item(self, item: T) -> bool:
-        return self.removeRow(self.__items.index(item))
+        return self.removeRow(self.__pos[id(item)])
 
     def delete_items(self, items: list[T]):
-        for item in sorted(items, key=lambda i: self.__items.index(i), reverse=True):
-            self.delete_item(item)
+        rows = sorted((self.__pos[id(item)] for item in items), reverse=True)
+
+        if not rows:
+            return
+
+        if len(rows) * 4 > len(self.__items):
+            dead = {id(item) for item in items}
+
+            self.beginResetModel()
+            with qtc.QWriteLocker(self._lock):
+                self.__items[:] = [
+                    item for item in self.__items if id(item) not in dead]
+
+                for key in dead:
+                    self.__pos.pop(key, None)
+
+                self.__reindex()
+            self.endResetModel()
+            return
+
+        start = end = rows[0]
+
+        for row in rows[1:]:
+            if row == start - 1:
+                start = row
+                continue
+
+            self.removeRows(start, end - start + 1)
+            start = end = row
+
+        self.removeRows(start, end - start + 1)
 
     def move_item(self, item: T, pos: int = -1):
-        item_pos = self.__items.index(item)
-        pos = _get_abs_pos(pos, self.rowCount())
+        item_pos = self.__pos[id(item)]
+        if pos < 0:
+            pos += self.rowCount() + 1
+
         return self.moveRow(item_pos, pos)
 
     def move_items(self, items: list[T], pos: int = -1):
-        pos = _get_abs_pos(pos, self.rowCount())
-        for i, item in enumerate(sorted(items, key=lambda i: self.__items.index(i), reverse=True)):
-            item_pos = self.__items.index(item)
-            self.moveRow(item_pos, pos + i)
+        if pos < 0:
+            pos += self.rowCount() + 1
+
+        ordered = sorted(items, key=lambda i: self.__pos[id(i)], reverse=True)
+        dst_row = pos
+        i = 0
+
+        while i < len(ordered):
+            start = self.__pos[id(ordered[i])]
+            count = 1
+
+            while (i + count < len(ordered)
+                   and self.__pos[id(ordered[i + count])] == start - count):
+                count += 1
+
+            start -= count - 1
+            self.moveRows(start, count, dst_row)
+
+            if start < dst_row:
+                dst_row -= count
+
+            i += count
+
+    @contextmanager
+    def batch(self, reset: bool = False):
+        """Group many mutations into a single view update.
+
+        Args:
+            reset: Use a full model reset instead of layout signals;
+                cheaper once a batch touches most of the model.
+        """
+        if reset:
+            self.beginResetModel()
+            yield
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            yield
+            self.layoutChanged.emit()
 
     def clear(self):
         self.beginResetModel()
-        del self.__items[:]
+        with qtc.QWriteLocker(self._lock):
+            del self.__items[:]
+            self.__pos.clear()
         self.endResetModel()
 
     def index(self, row: int = 0, column: int = 0,
               parent: qtc.QModelIndex | None = None) -> qtc.QModelIndex:
-        if 0 <= row <= self.rowCount():
-            return self.createIndex(row, column, self.__items[row])
+        with qtc.QReadLocker(self._lock):
+            items = self.__items
 
-    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole) -> Any:
+            if 0 <= row < len(items):
+                return self.createIndex(row, column, items[row])
 
-        if not index.isValid():
-            return None
-
-        item = index.internalPointer()
+        return qtc.QModelIndex()
 
-        if role == self.DataRole:
-            return item.data
+    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole,
+             _data_role: int = DataRole) -> Any:
+        if role != _data_role or not index.isValid():
+            return None
 
-        return None
+        return index.internalPointer().data
 
     def iter_indices(self) -> Iterator[qtc.QModelIndex]:
-        for i in range(self.rowCount()):
-            index = self.index(i)
+        create_index = self.createIndex
 
-            if index.isValid():
-                yield index
+        for i, item in enumerate(self.__items):
+            yield create_index(i, 0, item)
 
     def rowCount(self, _: qtc.QModelIndex | None = None) -> int:
-        return len(self.__items)
+        with qtc.QReadLocker(self._lock):
+            return len(self.__items)
 
     def columnCount(self, _: qtc.QModelIndex | None = None) -> int:
         return self.COL_COUNT
@@ -522,12 +729,13 @@ class ListTreeModel(qtc.QAbstractItemModel):
         if not 0 <= row <= self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertRows(parent, row, row)
         if item:
-            self.__items.insert(row, item)
+            with qtc.QWriteLocker(self._lock):
+                self.__items.insert(row, item)
+                self.__reindex(row)
         self.endInsertRows()
         return True
 
@@ -541,53 +749,62 @@ class ListTreeModel(qtc.QAbstractItemModel):
         if items and len(items) != count:
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginInsertRows(parent, row, row + count - 1)
         if items:
-            for i in range(count):
-                self.__items.insert(row + i, items[i])
+            with qtc.QWriteLocker(self._lock):
+                self.__items[row:row] = items
+                self.__reindex(row)
         self.endInsertRows()
         return True
 
     def removeRow(self, row: int, parent: qtc.QModelIndex | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex
+        parent = _valid_parent(parent)
 
         if not 0 <= row < self.rowCount():
             return False
 
         self.beginRemoveRows(parent, row, row)
-        del self.__items[row]
+        with qtc.QWriteLocker(self._lock):
+            self.__pos.pop(id(self.__items[row]), None)
+            del self.__items[row]
+            self.__reindex(row)
         self.endRemoveRows()
         return True
 
     def removeRows(self, row: int, count: int, parent: qtc.QModelIndex | None = None) -> bool:
         end_row = row + count - 1
-        if not 0 <= row < end_row < self.rowCount():
+        if not 0 <= row <= end_row < self.rowCount():
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginRemoveRows(parent, row, end_row)
-        del self.__items[row: end_row + 1]
+        with qtc.QWriteLocker(self._lock):
+            for item in self.__items[row: end_row + 1]:
+                self.__pos.pop(id(item), None)
+            del self.__items[row: end_row + 1]
+            self.__reindex(row)
         self.endRemoveRows()
         return True
 
     def moveRow(self, src_row: int, dst_row: int,
                 parent: qtc.QModelIndex | None = None) \
             -> bool:
-        if not 0 <= src_row | dst_row < self.rowCount():
+        count_ = self.rowCount()
+        if not (0 <= src_row < count_ and 0 <= dst_row <= count_):
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginMoveRows(parent, src_row, src_row, parent, dst_row)
-        item = self.__items.pop(src_row)
-        self.__items.insert(dst_row, item)
+        with qtc.QWriteLocker(self._lock):
+            item = self.__items.pop(src_row)
+
+            insert_at = dst_row - 1 if dst_row > src_row else dst_row
+            self.__items.insert(insert_at, item)
+            self.__reindex(min(src_row, insert_at))
         self.endMoveRows()
         return True
 
@@ -595,21 +812,31 @@ class ListTreeModel(qtc.QAbstractItemModel):
                  dst_row: int,
                  parent: qtc.QModelIndex | None = None) -> bool:
         end_row = src_row + count - 1
-        if 0 < src_row | dst_row < self.rowCount():
+        count_ = self.rowCount()
+        if not (0 <= src_row <= end_row < count_ and 0 <= dst_row <= count_):
             return False
 
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         self.beginMoveRows(parent, src_row, end_row, parent, dst_row)
-        items = self.__items[src_row: src_row + count]
-        [self.__items.remove(n) for n in items]
+        with qtc.QWriteLocker(self._lock):
+            block = self.__items[src_row: src_row + count]
+            del self.__items[src_row: src_row + count]
 
-        for i in range(count):
-            self.__items.insert(dst_row + count, items[i])
+            insert_at = dst_row - count if dst_row > src_row else dst_row
+            self.__items[insert_at:insert_at] = block
+            self.__reindex(min(src_row, insert_at))
         self.endMoveRows()
         return True
 
+    def __reindex(self, start: int = 0):
+        """Refresh the id->row map from the given row to the end."""
+        items = self.__items
+        pos = self.__pos
+
+        for i in range(start, len(items)):
+            pos[id(items[i])] = i
+
     @property
     def items(self) -> Iterator[T]:
         yield from self.__items
@@ -619,12 +846,14 @@ class TreeModel(qtc.QAbstractItemModel):
     """Tree Model."""
 
     HEADERS_NAME: tuple[str] = ("Name",)
-    DataRole = qtc.Qt.UserRole + 1
+    DataRole = int(qtc.Qt.UserRole + 1)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.COL_COUNT = len(self.HEADERS_NAME)
         self.root_item = TreeItem("root")
+        self.__item_index: dict[int, qtc.QPersistentModelIndex] = {}
+        self._lock = qtc.QReadWriteLock()
 
     def insert_item(self, item: TT,
                     parent_item: TT | None = None,
@@ -633,14 +862,14 @@ class TreeModel(qtc.QAbstractItemModel):
             parent_item = self.root_item
             parent_index = None
         else:
-            for index in self.iter_indices(recursive=True):
-                if index.internalPointer() == parent_item:
-                    parent_index = index
-                    break
-            else:
+            parent_index = self.__index_of(parent_item)
+
+            if parent_index is None:
                 raise ValueError(f"No parent index found from {parent_item.name!r}.")
 
-        pos = _get_abs_pos(pos, parent_item.child_count)
+        if pos < 0:
+            pos += parent_item.child_count + 1
+
         self.insertRow(pos, parent_index, item)
 
     def insert_items(self, items: list[TT],
@@ -650,92 +879,112 @@ class TreeModel(qtc.QAbstractItemModel):
             parent_item = self.root_item
             parent_index = None
         else:
-            for index in self.iter_indices(recursive=True):
-                if index.internalPointer() == parent_item:
-                    parent_index = index
-                    break
-            else:
+            parent_index = self.__index_of(parent_item)
+
+            if parent_index is None:
                 raise ValueError(f"No parent index found from {parent_item.name!r}.")
 
-        pos = _get_abs_pos(pos, parent_item.child_count)
+        if pos < 0:
+            pos += parent_item.child_count + 1
+
         self.insertRows(pos, len(items), parent_index, items)
 
     def delete_item(self, item: TT):
-        for idx in self.iter_indices(recursive=True):
-            if idx.internalPointer() == item:
-                self.removeRow(idx.row(), idx.parent())
-                break
+        idx = self.__index_of(item)
 
-    def delete_items(self, items: list[TT]):
-        idx_to_delete = []
-        for idx in self.iter_indices(recursive=True):
-            if idx.internalPointer() in items:
-                idx_to_delete.append(idx)
-                if len(idx_to_delete) == len(items):
-                    break
-
-        for idx in sorted(idx_to_delete, key=lambda i: i.row(), reverse=True):
+        if idx is not None:
             self.removeRow(idx.row(), idx.parent())
 
+    def delete_items(self, items: list[TT]):
+        by_parent: dict[qtc.QPersistentModelIndex, list[int]] = {}
+
+        for idx in map(self.__index_of, items):
+            if idx is not None:
+                parent = qtc.QPersistentModelIndex(idx.parent())
+                by_parent.setdefault(parent, []).append(idx.row())
+
+        for parent, rows in by_parent.items():
+            parent = qtc.QModelIndex(parent)
+            rows.sort(reverse=True)
+            start = end = rows[0]
+
+            for row in rows[1:]:
+                if row == start - 1:
+                    start = row
+                    continue
+
+                self.removeRows(start, end - start + 1, parent)
+                start = end = row
+
+            self.removeRows(start, end - start + 1, parent)
+
     def move_item(self, item: TT,
                   dst_parent_item: TT | None = None,
                   pos: int = -1):
-        item_index = None
-        dst_parent_index = None
-
         if dst_parent_item is None:
             dst_parent_item = self.root_item
 
-        for index in self.iter_indices(recursive=True):
-            it = index.internalPointer()
-            if it == item:
-                item_index = index
-            elif it == dst_parent_item:
-                dst_parent_index = index
+        item_index = self.__index_of(item)
+        dst_parent_index = (
+            qtc.QModelIndex() if dst_parent_item is self.root_item
+            else self.__index_of(dst_parent_item))
 
-            if item_index and dst_parent_index:
-                break
-        else:
+        if item_index is None or dst_parent_index is None:
             raise ValueError("Don't find parent index or destination index.")
 
-        pos = _get_abs_pos(pos, dst_parent_item.child_count)
-        self.moveRow(item_index.row(), pos, index.parent(), dst_parent_index)
+        if pos < 0:
+            pos += dst_parent_item.child_count + 1
+
+        self.moveRow(item_index.row(), pos, item_index.parent(),
+                     dst_parent_index)
 
     def move_items(self, items: list[TT],
                    dst_parent_item: TT | None = None,
                    pos: int = -1):
-        item_indices = []
-        dst_parent_index = None
-
         if dst_parent_item is None:
             dst_parent_item = self.root_item
 
-        for index in self.iter_indices(recursive=True):
-            item = index.internalPointer()
-            if item in items:
-                item_indices.append(index)
+        item_indices = [self.__index_of(item) for item in items]
+        dst_parent_index = (
+            qtc.QModelIndex() if dst_parent_item is self.root_item
+            else self.__index_of(dst_parent_item))
 
-            elif item == dst_parent_item:
-                dst_parent_index = index
-
-            if len(items) == len(item_indices) and dst_parent_index:
-                break
-        else:
+        if dst_parent_index is None or None in item_indices:
             raise ValueError("Don't find parent indices or destination index.")
 
-        pos = _get_abs_pos(pos, dst_parent_item.child_count)
+        if pos < 0:
+            pos += dst_parent_item.child_count + 1
+
         for i, index in enumerate(sorted(item_indices, key=lambda idx: idx.row(), reverse=True)):
             self.moveRow(index.row(), pos + i, index.parent(), dst_parent_index)
 
+    @contextmanager
+    def batch(self, reset: bool = False):
+        """Group many mutations into a single view update.
+
+        Args:
+            reset: Use a full model reset instead of layout signals;
+                cheaper once a batch touches most of the model.
+        """
+        if reset:
+            self.beginResetModel()
+            yield
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            yield
+            self.layoutChanged.emit()
+
     def clear(self):
         self.beginResetModel()
-        self.root_item = TreeItem("root")
+        with qtc.QWriteLocker(self._lock):
+            self.root_item = TreeItem("root")
+            self.__item_index.clear()
         self.endResetModel()
 
     def index(self, row: int, column: int,
               parent: qtc.QModelIndex | None = None) -> qtc.QModelIndex:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not self.hasIndex(row, column, parent):
             return qtc.QModelIndex()
@@ -745,9 +994,11 @@ class TreeModel(qtc.QAbstractItemModel):
         else:
             parent_item = parent.internalPointer()
 
-        child_item = parent_item.child(row)
-        if child_item:
-            return self.createIndex(row, column, child_item)
+        with qtc.QReadLocker(self._lock):
+            child_item = parent_item.child(row)
+
+            if child_item:
+                return self.createIndex(row, column, child_item)
 
         return qtc.QModelIndex()
 
@@ -758,34 +1009,52 @@ class TreeModel(qtc.QAbstractItemModel):
         child_item = index.internalPointer()
         parent_item = child_item.parent
 
-        if parent_item == self.root_item or parent_item is None:
+        if parent_item is None or parent_item is self.root_item:
             return qtc.QModelIndex()
 
-        return self.createIndex(parent_item.row(), 0, parent_item)
+        pidx = self.__item_index.get(id(parent_item))
 
-    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole) -> Any:
-        if not index.isValid():
-            return None
+        if pidx is not None and pidx.isValid():
+            return qtc.QModelIndex(pidx)
 
-        item = index.internalPointer()
+        return self.createIndex(parent_item.index, 0, parent_item)
 
-        if role == self.DataRole:
-            return item.data
+    def data(self, index: qtc.QModelIndex, role: qtc.Qt.ItemDataRole,
+             _data_role: int = DataRole) -> Any:
+        if role != _data_role or not index.isValid():
+            return None
 
-        return None
+        return index.internalPointer().data
 
     def iter_indices(self, parent: qtc.QModelIndex | None = None,
                      recursive: bool = False) \
             -> Iterator[qtc.QModelIndex]:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        if parent is None or not parent.isValid():
+            root = self.root_item
+        else:
+            root = parent.internalPointer()
+
+        create_index = self.createIndex
+
+        if not recursive:
+            for row, child in enumerate(root.children):
+                yield create_index(row, 0, child)
+
+            return
+
+        stack = [enumerate(root.children)]
 
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            yield index
+        while stack:
+            try:
+                row, child = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
 
-            if recursive:
-                yield from self.iter_indices(index, recursive)
+            yield create_index(row, 0, child)
+
+            if child.child_count:
+                stack.append(enumerate(child.children))
 
     def rowCount(self, index: qtc.QModelIndex | None = None) -> int:
         if index is None:
@@ -796,15 +1065,15 @@ class TreeModel(qtc.QAbstractItemModel):
         else:
             item = index.internalPointer()
 
-        return item.child_count
+        with qtc.QReadLocker(self._lock):
+            return item.child_count
 
     def columnCount(self, parent: qtc.QModelIndex | None = None) -> int:
         return self.COL_COUNT
 
     def insertRow(self, row: int, parent: qtc.QModelIndex | None = None,
                   item: TT | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not parent.isValid():
             parent_item = self.root_item
@@ -816,22 +1085,27 @@ class TreeModel(qtc.QAbstractItemModel):
 
         self.beginInsertRows(parent, row, row)
         if item:
-            parent_item.insert_child(item, row)
+            with qtc.QWriteLocker(self._lock):
+                parent_item.insert_child(item, row)
         self.endInsertRows()
+
+        if item:
+            with qtc.QWriteLocker(self._lock):
+                self.__register(item)
+
         return True
 
     def insertRows(self, row: int, count: int,
                    parent: qtc.QModelIndex | None = None,
                    items: list[TT] | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not parent.isValid():
             parent_item = self.root_item
         else:
             parent_item = parent.internalPointer()
 
-        if not 0 <= row < parent_item.child_count:
+        if not 0 <= row <= parent_item.child_count:
             return False
 
         if items and len(items) != count:
@@ -839,15 +1113,20 @@ class TreeModel(qtc.QAbstractItemModel):
 
         self.beginInsertRows(parent, row, row + count - 1)
         if items:
-            for i in range(count):
-                parent_item.insert_child(items[i], row + i)
+            with qtc.QWriteLocker(self._lock):
+                parent_item.insert_children(items, row)
         self.endInsertRows()
+
+        if items:
+            with qtc.QWriteLocker(self._lock):
+                for item in items:
+                    self.__register(item)
+
         return True
 
     def removeRow(self, row: int,
                   parent: qtc.QModelIndex | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not parent.isValid():
             parent_item = self.root_item
@@ -858,14 +1137,16 @@ class TreeModel(qtc.QAbstractItemModel):
             return False
 
         self.beginRemoveRows(parent, row, row)
-        parent_item.remove_child(parent_item.child(row))
+        with qtc.QWriteLocker(self._lock):
+            child = parent_item.child(row)
+            self.__unregister(child)
+            parent_item.remove_child(child)
         self.endRemoveRows()
         return True
 
     def removeRows(self, row: int, count: int,
                    parent: qtc.QModelIndex | None = None) -> bool:
-        if parent is None:
-            parent = qtc.QModelIndex()
+        parent = _valid_parent(parent)
 
         if not parent.isValid():
             parent_item = self.root_item
@@ -873,23 +1154,82 @@ class TreeModel(qtc.QAbstractItemModel):
             parent_item = parent.internalPointer()
 
         end_row = row + count - 1
-        if not 0 <= row < end_row < parent_item.child_count:
+        if not 0 <= row <= end_row < parent_item.child_count:
             return False
 
         self.beginRemoveRows(parent, row, end_row)
-        for i in reversed(range(count)):
-            parent_item.remove_child(parent_item.child(row + i))
+        with qtc.QWriteLocker(self._lock):
+            for i in range(count):
+                self.__unregister(parent_item.child(row + i))
+            parent_item.remove_children(row, count)
         self.endRemoveRows()
         return True
 
+    def __index_of(self, item: TT) -> qtc.QModelIndex | None:
+        """Return the cached index of the given item, or None."""
+        pidx = self.__item_index.get(id(item))
+
+        if pidx is not None:
+            if pidx.isValid():
+                return qtc.QModelIndex(pidx)
+
+            del self.__item_index[id(item)]
+
+        return self._find_indices({id(item)}).get(id(item))
+
+    def _find_indices(self, targets: set[int]) -> dict[int, qtc.QModelIndex]:
+        """Resolve the indexes of the items whose id() is in targets.
+
+        Pruned depth-first walk: returns as soon as every target has
+        been found instead of visiting the rest of the tree. Fallback
+        for items attached to the tree without going through the model.
+        """
+        found: dict[int, qtc.QModelIndex] = {}
+        pending = set(targets)
+        create_index = self.createIndex
+        stack = [enumerate(self.root_item.children)]
+
+        while stack and pending:
+            try:
+                row, child = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            key = id(child)
+
+            if key in pending:
+                pending.discard(key)
+                found[key] = create_index(row, 0, child)
+
+            if child.child_count:
+                stack.append(enumerate(child.children))
+
+        return found
+
+    def __register(self, item: TT):
+        """Cache persistent indices for the item and its subtree."""
+        item_index = self.__item_index
+        item_index[id(item)] = qtc.QPersistentModelIndex(
+            self.createIndex(item.index, 0, item))
+
+        for child in item.iter_children(recursive=True):
+            item_index[id(child)] = qtc.QPersistentModelIndex(
+                self.createIndex(child.index, 0, child))
+
+    def __unregister(self, item: TT):
+        """Drop the cached indices of the item and its subtree."""
+        self.__item_index.pop(id(item), None)
+
+        for child in item.iter_children(recursive=True):
+            self.__item_index.pop(id(child), None)
+
     def moveRow(self, src_row: int, dst_row: int,
                 src_parent: qtc.QModelIndex | None = None,
                 dst_parent: qtc.QModelIndex | None = None) -> bool:
-        if src_parent is None:
-            src_parent = qtc.QModelIndex()
+        src_parent = _valid_parent(src_parent)
 
-        if dst_parent is None:
-            dst_parent = qtc.QModelIndex()
+        dst_parent = _valid_parent(dst_parent)
 
         if not src_parent.isValid():
             src_item = self.root_item
@@ -909,8 +1249,13 @@ class TreeModel(qtc.QAbstractItemModel):
 
         self.beginMoveRows(src_parent, src_row, src_row,
                            dst_parent, dst_row)
-        item = src_item.child(src_row)
-        dst_item.insert_child(item, dst_row)
+        with qtc.QWriteLocker(self._lock):
+            item = src_item.child(src_row)
+
+            if src_item is dst_item and dst_row > src_row:
+                dst_row -= 1
+
+            dst_item.insert_child(item, dst_row)
         self.endMoveRows()
         return True
 
@@ -918,11 +1263,9 @@ class TreeModel(qtc.QAbstractItemModel):
                  src_parent: qtc.QModelIndex | None = None,
                  dst_parent: qtc.QModelIndex | None = None) -> bool:
 
-        if src_parent is None:
-            src_parent = qtc.QModelIndex()
+        src_parent = _valid_parent(src_parent)
 
-        if dst_parent is None:
-            dst_parent = qtc.QModelIndex()
+        dst_parent = _valid_parent(dst_parent)
 
         if not src_parent.isValid():
             src_item = self.root_item
@@ -940,25 +1283,15 @@ class TreeModel(qtc.QAbstractItemModel):
         if not 0 <= dst_row < dst_item.child_count:
             return False
 
-        self.beginMoveRows(src_parent, src_row, src_row + count,
+        self.beginMoveRows(src_parent, src_row, src_row + count - 1,
                            dst_parent, dst_row)
-        for i in range(count):
-            item = src_item.child(src_row)
-            dst_item.insert_child(item, dst_row + i)
-        self.endMoveRows()
-        return True
+        with qtc.QWriteLocker(self._lock):
+            block = src_item.pop_children(src_row, count)
 
+            if src_item is dst_item and dst_row > src_row:
+                dst_row -= count
 
-def _get_abs_pos(pos: int, len_: int) -> int:
-    """Return the absolute pos (int >= 0).
-
-    From the given pos and length of list.
-
-    Args:
-        pos (int): relative position.
-        len_ (int): length of the list.
+            dst_item.insert_children(block, dst_row)
+        self.endMoveRows()
+        return True
 
-    Return:
-        int
-    """
-    return pos if pos >= 0 else len_ + pos + 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TypeVar
 
 import Qt.QtCore as qtc
@@ -22,9 +23,27 @@ class AbstractView:
             index, qtc.QItemSelectionModel.Select | qtc.QItemSelectionModel.Rows)
 
     def select_indices(self, indices: list[qtc.QModelIndex]):
-        selection = qtc.QItemSelection
+        by_parent: dict[qtc.QPersistentModelIndex, list[qtc.QModelIndex]] = {}
+
         for idx in indices:
-            selection.select(idx, idx)
+            parent = qtc.QPersistentModelIndex(idx.parent())
+            by_parent.setdefault(parent, []).append(idx)
+
+        selection = qtc.QItemSelection()
+
+        for group in by_parent.values():
+            group.sort(key=lambda i: i.row())
+            first = last = group[0]
+
+            for idx in group[1:]:
+                if idx.row() == last.row() + 1:
+                    last = idx
+                    continue
+
+                selection.select(first, last)
+                first = last = idx
+
+            selection.select(first, last)
 
         self.selectionModel().select(
             selection, qtc.QItemSelectionModel.Select | qtc.QItemSelectionModel.Rows)
@@ -43,6 +62,10 @@ class AbstractView:
     def selected_items(self) -> list[T]:
         return [idx.internalPointer() for idx in self.selected_indices()]
 
+    def iter_selected_items(self) -> Iterator[T]:
+        """Iterate selected items without materializing a list."""
+        return (idx.internalPointer() for idx in self.selected_indices())
+
 
 class ListView(qtw.QListView, AbstractView):
     """List View without columns."""
@@ -51,6 +74,7 @@ class ListView(qtw.QListView, AbstractView):
         super().__init__(*args, **kwargs)
         self.setSelectionMode(qtw.QAbstractItemView.ExtendedSelection)
         self.setAlternatingRowColors(True)
+        self.setUniformItemSizes(True)
 
 
 class TableView(qtw.QTableView, AbstractView):